@@ -16,7 +16,14 @@ from .sdk.types import (
     VerificationMethod,
     ServiceEndpoint,
 )
-from .crypto.keys import KeyPair
+from .crypto.keys import KeyPair, SecretBytes
+
+# Errors
+from .sdk.resolver import (
+    InvalidDIDSyntaxError,
+    UnsupportedMethodError,
+    PublicKeyExtractionError,
+)
 
 __version__ = "0.1.0"
 __all__ = [
@@ -31,4 +38,9 @@ __all__ = [
     "VerificationMethod",
     "ServiceEndpoint",
     "KeyPair",
+    "SecretBytes",
+    # Errors
+    "InvalidDIDSyntaxError",
+    "UnsupportedMethodError",
+    "PublicKeyExtractionError",
 ]
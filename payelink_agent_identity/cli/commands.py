@@ -8,7 +8,8 @@ from pathlib import Path
 from typing import Optional
 
 from ..sdk.generator import DIDGenerator
-from ..sdk.types import ServiceEndpoint
+from ..sdk.types import DIDDocument
+from ..utils.validation import validate_did_syntax, parse_did
 from ..utils.constants import (
     VR_AUTHENTICATION,
     VR_ASSERTION,
@@ -19,6 +20,17 @@ from ..utils.constants import (
     SERVICE_TYPE_DID_COMM
 )
 
+# Option choices
+KEY_TYPE_CHOICES = ('Ed25519',)
+VR_CHOICES = (
+    VR_AUTHENTICATION,
+    VR_ASSERTION,
+    VR_KEY_AGREEMENT,
+    VR_CAPABILITY_INVOCATION,
+    VR_CAPABILITY_DELEGATION
+)
+OUTPUT_FORMAT_CHOICES = ('json', 'json-ld')
+
 
 @click.group()
 @click.version_option(version="0.1.0")
@@ -35,7 +47,7 @@ def cli():
 @cli.command()
 @click.option(
     '--key-type',
-    type=click.Choice(['Ed25519'], case_sensitive=False),
+    type=click.Choice(KEY_TYPE_CHOICES, case_sensitive=False),
     default='Ed25519',
     help='Cryptographic key type (default: Ed25519)'
 )
@@ -43,13 +55,7 @@ def cli():
     '--verification-relationships',
     '-vr',
     multiple=True,
-    type=click.Choice([
-        VR_AUTHENTICATION,
-        VR_ASSERTION,
-        VR_KEY_AGREEMENT,
-        VR_CAPABILITY_INVOCATION,
-        VR_CAPABILITY_DELEGATION
-    ]),
+    type=click.Choice(VR_CHOICES),
     help='Verification relationships to include (can specify multiple times)'
 )
 @click.option(
@@ -59,7 +65,7 @@ def cli():
 )
 @click.option(
     '--output-format',
-    type=click.Choice(['json', 'json-ld']),
+    type=click.Choice(OUTPUT_FORMAT_CHOICES),
     default='json-ld',
     help='Output format (default: json-ld)'
 )
@@ -96,22 +102,25 @@ def generate(
         payelink-agent-identity generate -vr authentication -vr assertionMethod
         payelink-agent-identity generate --service-type MessagingService:https://agent.example.com/inbox
     """
+    # Output is collected and written in one go rather than line by line
+    lines = []
+    
     try:
         generator = DIDGenerator()
         
         # Parse verification relationships
         vr_list = list(verification_relationships) if verification_relationships else None
         
-        # Parse service endpoint
+        # Parse service endpoint (validated once by the document builder)
         services = None
         if service_type:
             parts = service_type.split(':', 1)
             if len(parts) == 2:
-                services = [ServiceEndpoint(
-                    id=f"#service-1",
-                    type=parts[0],
-                    serviceEndpoint=parts[1]
-                )]
+                services = [{
+                    "id": "#service-1",
+                    "type": parts[0],
+                    "serviceEndpoint": parts[1]
+                }]
         
         # Parse also known as
         aka_list = list(also_known_as) if also_known_as else None
@@ -125,8 +134,8 @@ def generate(
         )
         
         # Display results
-        click.echo(click.style("\n✓ DID Generated Successfully!", fg='green', bold=True))
-        click.echo(f"\nDID: {click.style(result.did, fg='cyan', bold=True)}")
+        lines.append(click.style("\n✓ DID Generated Successfully!", fg='green', bold=True))
+        lines.append(f"\nDID: {click.style(result.did, fg='cyan', bold=True)}")
         
         # Export document
         if output_format == 'json-ld':
@@ -134,14 +143,14 @@ def generate(
         else:
             doc_output = generator.export_json(result.document)
         
-        click.echo(f"\nDID Document ({output_format}):")
-        click.echo(doc_output)
+        lines.append(f"\nDID Document ({output_format}):")
+        lines.append(doc_output)
         
         # Save to file if requested
         if save_to:
             output_path = Path(save_to)
             output_path.write_text(doc_output)
-            click.echo(f"\n✓ DID document saved to: {output_path}")
+            lines.append(f"\n✓ DID document saved to: {output_path}")
             
             if save_keys:
                 key_path = output_path.with_suffix('.key')
@@ -153,7 +162,7 @@ def generate(
                     "WARNING": "Keep this file secure! Never share private keys!"
                 }
                 key_path.write_text(json.dumps(key_data, indent=2))
-                click.echo(click.style(
+                lines.append(click.style(
                     f"⚠  Private key saved to: {key_path} (KEEP SECURE!)",
                     fg='yellow',
                     bold=True
@@ -161,12 +170,17 @@ def generate(
         
         # Security warning if keys not saved
         if not save_keys:
-            click.echo(click.style(
+            lines.append(click.style(
                 "\n⚠  Private key not saved. You won't be able to use this DID for signing!",
                 fg='yellow'
             ))
         
+        click.echo("\n".join(lines))
+        
     except Exception as e:
+        # Show whatever was produced before the failure, as before
+        if lines:
+            click.echo("\n".join(lines))
         click.echo(click.style(f"\n✗ Error: {str(e)}", fg='red'), err=True)
         sys.exit(1)
 
@@ -175,7 +189,7 @@ def generate(
 @click.argument('did')
 @click.option(
     '--output-format',
-    type=click.Choice(['json', 'json-ld']),
+    type=click.Choice(OUTPUT_FORMAT_CHOICES),
     default='json-ld',
     help='Output format'
 )
@@ -211,8 +225,6 @@ def validate(did):
     Example:
         payelink-agent-identity validate did:key:z6MkhaXgBZDvotDkL5257faiztiGiC2QtKLGpbnnEGta2doK
     """
-    from ..utils.validation import validate_did_syntax, parse_did
-    
     if validate_did_syntax(did):
         method, method_id = parse_did(did)
         click.echo(click.style("✓ Valid DID syntax", fg='green'))
@@ -233,8 +245,6 @@ def verify_document(did_file):
         payelink-agent-identity verify-document my-did.json
     """
     try:
-        from ..sdk.types import DIDDocument
-        
         content = Path(did_file).read_text()
         doc_data = json.loads(content)
         
@@ -1,5 +1,5 @@
 """Cryptographic operations for DIDs"""
 
-from .keys import KeyPair
+from .keys import KeyPair, SecretBytes
 
-__all__ = ["KeyPair"]
+__all__ = ["KeyPair", "SecretBytes"]
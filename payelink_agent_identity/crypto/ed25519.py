@@ -0,0 +1,101 @@
+"""
+Ed25519 public key point validation
+Reference: RFC 8032 Section 5.1.3 - Decoding
+
+Used when PyNaCl (libsodium) is not installed. Accepts exactly the keys
+libsodium's crypto_core_ed25519_is_valid_point accepts: a canonical
+encoding of a curve point that is not the identity and lies in the
+prime-order subgroup.
+"""
+from typing import Optional, Tuple
+
+# A point in extended coordinates (X, Y, Z, T)
+_Point = Tuple[int, int, int, int]
+
+# Field prime, curve constant d and group order L (RFC 8032 Section 5.1)
+_P = 2**255 - 19
+_D = (-121665 * pow(121666, _P - 2, _P)) % _P
+_L = 2**252 + 27742317777372353535851937790883648493
+
+# Square root of -1 mod p, used in square root recovery
+_SQRT_M1 = pow(2, (_P - 1) // 4, _P)
+
+# Identity in extended coordinates
+_IDENTITY: _Point = (0, 1, 1, 0)
+
+
+def _decode_point(encoded: bytes) -> Optional[_Point]:
+    """
+    Decode a 32-byte point encoding to extended coordinates
+    
+    Returns None if the encoding is not canonical or not on the curve.
+    """
+    y = int.from_bytes(encoded, 'little')
+    sign = y >> 255
+    y &= (1 << 255) - 1
+    if y >= _P:
+        return None
+    
+    # x^2 = (y^2 - 1) / (d*y^2 + 1)
+    u = (y * y - 1) % _P
+    v = (_D * y * y + 1) % _P
+    x = (u * pow(v, 3, _P) * pow(u * pow(v, 7, _P), (_P - 5) // 8, _P)) % _P
+    
+    vxx = (v * x * x) % _P
+    if vxx == (-u) % _P:
+        x = (x * _SQRT_M1) % _P
+    elif vxx != u:
+        return None
+    
+    if x == 0 and sign:
+        return None
+    if (x & 1) != sign:
+        x = _P - x
+    
+    return (x, y, 1, (x * y) % _P)
+
+
+def _add(p: _Point, q: _Point) -> _Point:
+    """Add two points in extended coordinates"""
+    x1, y1, z1, t1 = p
+    x2, y2, z2, t2 = q
+    a = ((y1 - x1) * (y2 - x2)) % _P
+    b = ((y1 + x1) * (y2 + x2)) % _P
+    c = (2 * _D * t1 * t2) % _P
+    d = (2 * z1 * z2) % _P
+    e, f, g, h = b - a, d - c, d + c, b + a
+    return ((e * f) % _P, (g * h) % _P, (f * g) % _P, (e * h) % _P)
+
+
+def _multiply(point: _Point, scalar: int) -> _Point:
+    """Multiply a point by a non-negative scalar (double-and-add)"""
+    result = _IDENTITY
+    while scalar:
+        if scalar & 1:
+            result = _add(result, point)
+        point = _add(point, point)
+        scalar >>= 1
+    return result
+
+
+def _is_identity(point: _Point) -> bool:
+    x, y, z, _ = point
+    return x % _P == 0 and (y - z) % _P == 0
+
+
+def is_valid_point(encoded: bytes) -> bool:
+    """
+    Check that a 32-byte Ed25519 public key encodes a usable curve point
+    
+    Rejects non-canonical encodings, points off the curve, the identity
+    and any point outside the prime-order subgroup (which includes every
+    small-order point).
+    """
+    if len(encoded) != 32:
+        return False
+    
+    point = _decode_point(bytes(encoded))
+    if point is None or _is_identity(point):
+        return False
+    
+    return _is_identity(_multiply(point, _L))
@@ -1,16 +1,50 @@
 """
 Cryptographic key pair abstraction
 """
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class KeyPair(BaseModel):
+class SecretBytes(bytearray):
+    """
+    Private key material that is zeroed in memory when released
+    
+    Behaves like a bytearray (compares equal to the same bytes, supports
+    .hex()), but is unhashable and its repr, str and format output never
+    show the contents.
+    Copies made with bytes(...) are ordinary objects and are not zeroed.
+    """
+    __slots__ = ()
+    
+    def zeroize(self) -> None:
+        """Overwrite the key material with zeros (in place)"""
+        self[:] = bytes(len(self))
+    
+    def __del__(self) -> None:
+        self.zeroize()
+    
+    def __repr__(self) -> str:
+        return f"SecretBytes(<{len(self)} bytes>)"
+    
+    # bytearray's own str() and format() would print the contents
+    __str__ = __repr__
+    
+    def __format__(self, format_spec: str) -> str:
+        return format(repr(self), format_spec)
+
+
+@dataclass(frozen=True)
+class KeyPair:
     """
     Cryptographic key pair
     """
+    # Declared by hand: dataclass(slots=True) requires Python 3.10+
+    __slots__ = ("public_key", "private_key", "key_type")
+    
     public_key: bytes
-    private_key: bytes
+    private_key: SecretBytes
     key_type: str
     
-    class Config:
-        arbitrary_types_allowed = True
+    def __reduce__(self):
+        # Frozen slotted instances cannot be restored via setattr, so pickle
+        # and copy through the constructor instead
+        return (KeyPair, (self.public_key, self.private_key, self.key_type))
@@ -9,6 +9,11 @@ from .types import (
     VerificationMethod,
     ServiceEndpoint,
 )
+from .resolver import (
+    InvalidDIDSyntaxError,
+    UnsupportedMethodError,
+    PublicKeyExtractionError,
+)
 
 __all__ = [
     "Identity",
@@ -18,4 +23,7 @@ __all__ = [
     "DIDResolutionResult",
     "VerificationMethod",
     "ServiceEndpoint",
+    "InvalidDIDSyntaxError",
+    "UnsupportedMethodError",
+    "PublicKeyExtractionError",
 ]
@@ -2,8 +2,11 @@
 DID Document Builder
 Spec reference: Section 5 - Core Properties
 """
-from typing import List, Optional, Union
-from .types import DIDDocument, VerificationMethod, ServiceEndpoint
+from typing import Annotated, Any, Dict, List, Optional, Union
+
+from pydantic import AfterValidator, TypeAdapter
+
+from .types import DIDDocument, VerificationMethod, ServiceEndpoint, _check_did, _construct
 from ..utils.encoding import MultibaseEncoder, MulticodecEncoder
 from ..utils.constants import (
     DID_CONTEXT_V1,
@@ -16,6 +19,26 @@ from ..utils.constants import (
     VR_CAPABILITY_DELEGATION
 )
 
+# Verification relationship -> DID document property (Spec 5.3)
+_VR_TO_PROPERTY = {
+    VR_AUTHENTICATION: "authentication",
+    VR_ASSERTION: "assertionMethod",
+    VR_KEY_AGREEMENT: "keyAgreement",
+    VR_CAPABILITY_INVOCATION: "capabilityInvocation",
+    VR_CAPABILITY_DELEGATION: "capabilityDelegation",
+}
+
+# @context for Ed25519 documents (Spec 6.3.1). Stored as a tuple and copied
+# into each document, since the model field must hold a list.
+_ED25519_CONTEXT = (DID_CONTEXT_V1, ED25519_2020_CONTEXT)
+
+# Validators for the document fields that come from the caller, matching the
+# DIDDocument field types, so documents can be assembled without validating
+# the fields the builder derives itself
+_DID_ADAPTER = TypeAdapter(Annotated[str, AfterValidator(_check_did)])
+_ALSO_KNOWN_AS_ADAPTER = TypeAdapter(List[str])
+_CONTROLLER_ADAPTER = TypeAdapter(Union[str, List[str]])
+
 
 class DIDDocumentBuilder:
     """
@@ -35,9 +58,10 @@ class DIDDocumentBuilder:
         public_key: bytes,
         key_type: str = "Ed25519",
         verification_relationships: Optional[List[str]] = None,
-        services: Optional[List[ServiceEndpoint]] = None,
+        services: Optional[List[Union[ServiceEndpoint, Dict[str, Any]]]] = None,
         also_known_as: Optional[List[str]] = None,
-        controller: Optional[Union[str, List[str]]] = None
+        controller: Optional[Union[str, List[str]]] = None,
+        multibase_key: Optional[str] = None
     ) -> DIDDocument:
         """
         Build a complete DID document
@@ -47,9 +71,12 @@ class DIDDocumentBuilder:
             public_key: Raw public key bytes
             key_type: Type of key (default: Ed25519)
             verification_relationships: List of relationships to include
-            services: Optional service endpoints (Spec 5.4)
+            services: Optional service endpoints (Spec 5.4), as ServiceEndpoint
+                instances or dicts (validated here, once)
             also_known_as: Alternative identifiers (Spec 5.1.3)
             controller: DID controller(s) (Spec 5.1.2)
+            multibase_key: Multibase encoding of the public key, if already
+                known (e.g. the method-specific id of a did:key DID)
         
         Returns:
             Complete DIDDocument
@@ -57,50 +84,55 @@ class DIDDocumentBuilder:
         if verification_relationships is None:
             verification_relationships = [VR_AUTHENTICATION]
         
+        # Validate the DID (Spec 3.1); everything else in the document
+        # derives from it
+        did = _DID_ADAPTER.validate_python(did)
+        
         # Build context (Spec 6.3.1)
         context = self._build_context(key_type)
         
         # Build verification method (Spec 5.2)
         verification_method = self._build_verification_method(
-            did, public_key, key_type
+            did, public_key, key_type, multibase_key
         )
         
         # Build document
         doc_dict = {
-            "@context": context,
+            "context": context,
             "id": did,
             "verificationMethod": [verification_method]
         }
         
-        # Add verification relationships (Spec 5.3)
+        # Add verification relationships (Spec 5.3). Every relationship
+        # references the same vm_id object, just as the verification method's
+        # controller is the `did` object itself, so the repeated DID strings
+        # in the serialized document cost no extra memory per document.
         vm_id = verification_method.id
         
-        if VR_AUTHENTICATION in verification_relationships:
-            doc_dict["authentication"] = [vm_id]
-        
-        if VR_ASSERTION in verification_relationships:
-            doc_dict["assertionMethod"] = [vm_id]
-        
-        if VR_KEY_AGREEMENT in verification_relationships:
-            doc_dict["keyAgreement"] = [vm_id]
-        
-        if VR_CAPABILITY_INVOCATION in verification_relationships:
-            doc_dict["capabilityInvocation"] = [vm_id]
+        for relationship in frozenset(verification_relationships).intersection(_VR_TO_PROPERTY):
+            doc_dict[_VR_TO_PROPERTY[relationship]] = [vm_id]
         
-        if VR_CAPABILITY_DELEGATION in verification_relationships:
-            doc_dict["capabilityDelegation"] = [vm_id]
-        
-        # Add optional properties
+        # Add optional properties. These come from the caller, so they are
+        # validated; validation also copies lists, so documents never share
+        # mutable state with the caller (or with each other in batch builds).
         if also_known_as:
-            doc_dict["alsoKnownAs"] = also_known_as
+            doc_dict["alsoKnownAs"] = _ALSO_KNOWN_AS_ADAPTER.validate_python(also_known_as)
         
         if controller:
-            doc_dict["controller"] = controller
+            doc_dict["controller"] = _CONTROLLER_ADAPTER.validate_python(controller)
         
         if services:
-            doc_dict["service"] = services
-        
-        return DIDDocument(**doc_dict)
+            # Services come from the caller, so validate any that are not
+            # already ServiceEndpoint instances
+            doc_dict["service"] = [
+                service if isinstance(service, ServiceEndpoint)
+                else ServiceEndpoint.model_validate(service)
+                for service in services
+            ]
+        
+        # Caller-supplied fields were validated above and every other field
+        # was derived from them, so skip whole-model validation
+        return _construct(DIDDocument, **doc_dict)
     
     def _build_context(self, key_type: str) -> List[str]:
         """
@@ -108,18 +140,17 @@ class DIDDocumentBuilder:
         
         Spec 6.3.1: JSON-LD context must include DID v1 context
         """
-        contexts = [DID_CONTEXT_V1]
-        
         if key_type == "Ed25519":
-            contexts.append(ED25519_2020_CONTEXT)
+            return list(_ED25519_CONTEXT)
         
-        return contexts
+        return [DID_CONTEXT_V1]
     
     def _build_verification_method(
         self,
         did: str,
         public_key: bytes,
-        key_type: str
+        key_type: str,
+        multibase_key: Optional[str] = None
     ) -> VerificationMethod:
         """
         Build verification method entry
@@ -127,25 +158,29 @@ class DIDDocumentBuilder:
         Spec 5.2: Each verification method must have id, type, controller,
         and verification material (publicKeyMultibase or publicKeyJwk)
         """
+        # Encode public key as multibase (Spec 5.2.1), unless the caller
+        # already has it (for did:key it is the method-specific id)
+        if multibase_key is None:
+            multicodec_key = MulticodecEncoder.encode_public_key(public_key, key_type)
+            multibase_key = MultibaseEncoder.encode(multicodec_key)
+        
         # Create verification method ID (fragment identifier)
-        # For did:key, use the same encoded key as fragment
-        multicodec_key = MulticodecEncoder.encode_public_key(public_key, key_type)
-        multibase_key = MultibaseEncoder.encode(multicodec_key)
+        # For did:key, use the same encoded key as fragment. This is the only
+        # new string the method needs; the remaining fields reference `did`
+        # and `multibase_key` directly.
         vm_id = f"{did}#{multibase_key}"
         
-        # Encode public key as multibase (Spec 5.2.1)
-        public_key_multibase = multibase_key
-        
         # Determine verification method type
         vm_type = VM_TYPE_ED25519_2020 if key_type == "Ed25519" else "Unknown"
         
         # Only include publicKeyMultibase, not publicKeyJwk
         # publicKeyJwk will be None by default and excluded in export
-        return VerificationMethod(
+        return _construct(
+            VerificationMethod,
             id=vm_id,
             type=vm_type,
             controller=did,
-            publicKeyMultibase=public_key_multibase
+            publicKeyMultibase=multibase_key
         )
     
     def add_service(
@@ -159,6 +194,9 @@ class DIDDocumentBuilder:
         Add a service to existing document
         
         Spec 5.4: Services enable communication with DID subject
+        
+        Documents are immutable, so this returns a new document with the
+        service appended and leaves the given document unchanged.
         """
         service = ServiceEndpoint(
             id=service_id,
@@ -166,9 +204,6 @@ class DIDDocumentBuilder:
             serviceEndpoint=service_endpoint
         )
         
-        if document.service is None:
-            document.service = []
-        
-        document.service.append(service)
-        
-        return document
+        return document.model_copy(
+            update={"service": [*(document.service or []), service]}
+        )
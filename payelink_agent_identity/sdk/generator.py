@@ -2,16 +2,56 @@
 Main DID Generator
 Spec reference: Section 1 - Introduction & Section 8.2 - Method Operations
 """
-from typing import Optional, List, Dict, Any
+import json
+import os
+from functools import partial
+from typing import Optional, List, Dict, Any, Union
+
+try:
+    # Rust-backed JSON serializer (optional, installed with the "fast" extra)
+    import orjson
+except ImportError:
+    orjson = None
+
+from pydantic import BaseModel
 
 from .key_manager import KeyManager
+from ..crypto.keys import KeyPair
 from .document_builder import DIDDocumentBuilder
 from .resolver import DIDKeyResolver
-from ..utils.encoding import create_did_key_identifier
-from ..utils.constants import VR_AUTHENTICATION, VR_ASSERTION
+from ..utils.encoding import create_did_key_identifier, create_did_key_identifiers
+from ..utils.constants import DID_KEY_PREFIX, VR_AUTHENTICATION, VR_ASSERTION
 from .types import DIDDocument, DIDGenerationResult, ServiceEndpoint
 
 
+def _export_snapshot(document: DIDDocument) -> Optional[tuple]:
+    """
+    Capture a document's field values for validating memoized output
+    
+    Top-level lists are copied to tuples. Their items must be strings or
+    models whose fields are all strings or None (e.g. a VerificationMethod
+    without publicKeyJwk); anything else, such as a dict in @context or a
+    structured serviceEndpoint, could change in place unnoticed, so None
+    is returned to disable the memo for that document.
+    """
+    snapshot = []
+    for value in document.__dict__.values():
+        if isinstance(value, list):
+            for item in value:
+                if isinstance(item, str):
+                    continue
+                if not isinstance(item, BaseModel) or not all(
+                    field is None or isinstance(field, str)
+                    for field in item.__dict__.values()
+                ):
+                    return None
+            value = tuple(value)
+        elif value is not None and not isinstance(value, str):
+            return None
+        snapshot.append(value)
+    return tuple(snapshot)
+
+
 class DIDGenerator:
     """
     Main class for generating did:key DIDs
@@ -32,7 +72,7 @@ class DIDGenerator:
         self,
         key_type: str = "Ed25519",
         verification_relationships: Optional[List[str]] = None,
-        services: Optional[List[ServiceEndpoint]] = None,
+        services: Optional[List[Union[ServiceEndpoint, Dict[str, Any]]]] = None,
         also_known_as: Optional[List[str]] = None
     ) -> DIDGenerationResult:
         """
@@ -43,7 +83,8 @@ class DIDGenerator:
             verification_relationships: List of relationships to include
                 Options: authentication, assertionMethod, keyAgreement,
                         capabilityInvocation, capabilityDelegation
-            services: Optional service endpoints
+            services: Optional service endpoints (ServiceEndpoint instances
+                or equivalent dicts)
             also_known_as: Optional alternative identifiers
             
         Returns:
@@ -63,6 +104,139 @@ class DIDGenerator:
         # Step 2: Create DID identifier
         did = create_did_key_identifier(key_pair.public_key, key_type)
         
+        return self._build_result(
+            key_pair,
+            did,
+            key_type,
+            verification_relationships,
+            services,
+            also_known_as
+        )
+    
+    def generate_batch(
+        self,
+        n: int,
+        key_type: str = "Ed25519",
+        verification_relationships: Optional[List[str]] = None,
+        services: Optional[List[Union[ServiceEndpoint, Dict[str, Any]]]] = None,
+        also_known_as: Optional[List[str]] = None
+    ) -> List[DIDGenerationResult]:
+        """
+        Generate n new DIDs sharing the same document options
+        
+        Equivalent to calling generate() n times, but the key material for
+        the whole batch is drawn from the OS CSPRNG at once.
+        
+        Args:
+            n: Number of DIDs to generate
+            key_type: Type of cryptographic key (default: Ed25519)
+            verification_relationships: List of relationships to include
+            services: Optional service endpoints (added to every document)
+            also_known_as: Optional alternative identifiers
+            
+        Returns:
+            List of n DIDGenerationResults
+        """
+        # Default to authentication and assertion if not specified
+        if verification_relationships is None:
+            verification_relationships = [VR_AUTHENTICATION, VR_ASSERTION]
+        
+        key_pairs = self.key_manager.generate_ed25519_keypair_batch(n)
+        dids = create_did_key_identifiers(
+            [key_pair.public_key for key_pair in key_pairs],
+            key_type
+        )
+        
+        return [
+            self._build_result(
+                key_pair,
+                did,
+                key_type,
+                verification_relationships,
+                services,
+                also_known_as
+            )
+            for key_pair, did in zip(key_pairs, dids)
+        ]
+    
+    def generate_many(
+        self,
+        n: int,
+        key_type: str = "Ed25519",
+        verification_relationships: Optional[List[str]] = None,
+        services: Optional[List[Union[ServiceEndpoint, Dict[str, Any]]]] = None,
+        also_known_as: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False
+    ) -> List[DIDGenerationResult]:
+        """
+        Generate n new DIDs in parallel
+        
+        The work is split into one generate_batch() call per worker. Threads
+        are used by default; key generation runs in native code, but
+        document building holds the GIL, so pass use_processes=True to
+        scale the whole pipeline across cores.
+        
+        Args:
+            n: Number of DIDs to generate
+            key_type: Type of cryptographic key (default: Ed25519)
+            verification_relationships: List of relationships to include
+            services: Optional service endpoints (added to every document)
+            also_known_as: Optional alternative identifiers
+            max_workers: Number of workers, at least 1 (default: CPU count)
+            use_processes: Use a process pool instead of a thread pool
+            
+        Returns:
+            List of n DIDGenerationResults
+        """
+        if n < 0:
+            raise ValueError(f"Batch size must be non-negative, got {n}")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        workers = max(1, min(n, max_workers))
+        chunk_sizes = [
+            n // workers + (1 if i < n % workers else 0)
+            for i in range(workers)
+        ]
+        
+        options: Dict[str, Any] = dict(
+            key_type=key_type,
+            verification_relationships=verification_relationships,
+            services=services,
+            also_known_as=also_known_as
+        )
+        
+        # Imported here since only generate_many needs the executors
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        
+        if use_processes:
+            # Only the options are pickled for each task, not this generator
+            # (whose resolver cache can be large)
+            generate_chunk = partial(_generate_batch_in_worker, **options)
+        else:
+            generate_chunk = partial(self.generate_batch, **options)
+        
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor_class(max_workers=workers) as executor:
+            chunks = list(executor.map(generate_chunk, chunk_sizes))
+        
+        return [result for chunk in chunks for result in chunk]
+    
+    def _build_result(
+        self,
+        key_pair: KeyPair,
+        did: str,
+        key_type: str,
+        verification_relationships: List[str],
+        services: Optional[List[Union[ServiceEndpoint, Dict[str, Any]]]],
+        also_known_as: Optional[List[str]]
+    ) -> DIDGenerationResult:
+        """
+        Build the document and result for a freshly generated key pair
+        """
         # Step 3: Build DID document
         document = self.document_builder.build(
             did=did,
@@ -70,11 +244,13 @@ class DIDGenerator:
             key_type=key_type,
             verification_relationships=verification_relationships,
             services=services,
-            also_known_as=also_known_as
+            also_known_as=also_known_as,
+            multibase_key=did[len(DID_KEY_PREFIX):]
         )
         
-        # Step 4: Return result
-        return DIDGenerationResult(
+        # Step 4: Return result (every field is produced internally, so
+        # skip pydantic validation)
+        return DIDGenerationResult.model_construct(
             did=did,
             document=document,
             public_key=key_pair.public_key,
@@ -87,7 +263,7 @@ class DIDGenerator:
         public_key: bytes,
         key_type: str = "Ed25519",
         verification_relationships: Optional[List[str]] = None,
-        services: Optional[List[ServiceEndpoint]] = None
+        services: Optional[List[Union[ServiceEndpoint, Dict[str, Any]]]] = None
     ) -> Dict[str, Any]:
         """
         Generate DID document from existing public key
@@ -104,7 +280,8 @@ class DIDGenerator:
             public_key=public_key,
             key_type=key_type,
             verification_relationships=verification_relationships,
-            services=services
+            services=services,
+            multibase_key=did[len(DID_KEY_PREFIX):]
         )
         
         return {
@@ -128,18 +305,7 @@ class DIDGenerator:
         
         Spec: Section 6.2 - JSON Representation
         """
-        # Exclude None values and empty lists/collections
-        doc_dict = document.model_dump(
-            by_alias=True,
-            exclude_none=True,
-            exclude_unset=False
-        )
-        
-        # Remove empty lists and empty dicts
-        cleaned_dict = self._remove_empty_fields(doc_dict)
-        
-        import json
-        return json.dumps(cleaned_dict, indent=indent)
+        return self._serialize(document, indent)
     
     def export_json_ld(self, document: DIDDocument, indent: int = 2) -> str:
         """
@@ -149,6 +315,24 @@ class DIDGenerator:
         
         For did:key with Ed25519, we include the Ed25519 context
         """
+        return self._serialize(document, indent)
+    
+    def _serialize(self, document: DIDDocument, indent: Optional[int]) -> str:
+        """
+        Serialize a DID document, memoizing the output on the document
+        
+        The JSON and JSON-LD representations share the same serialization,
+        so one cache entry per indent serves both. Documents are frozen but
+        their list fields can still be changed in place, so an entry is only
+        reused while a snapshot of those lists still matches. Documents with
+        mutable values below the top-level lists are not memoized at all.
+        """
+        snapshot = _export_snapshot(document)
+        if snapshot is not None:
+            cached = document._export_cache.get(indent)
+            if cached is not None and cached[0] == snapshot:
+                return cached[1]
+        
         # Exclude None values and empty lists/collections
         doc_dict = document.model_dump(
             by_alias=True,
@@ -157,33 +341,77 @@ class DIDGenerator:
         )
         
         # Remove empty lists and empty dicts
-        cleaned_dict = self._remove_empty_fields(doc_dict)
+        self._remove_empty_fields(doc_dict)
+        
+        output = self._dumps(doc_dict, indent)
+        if snapshot is not None:
+            document._export_cache[indent] = (snapshot, output)
+        return output
+    
+    @staticmethod
+    def _dumps(data: Dict[str, Any], indent: Optional[int]) -> str:
+        """
+        Encode a dumped document as JSON
         
-        import json
-        return json.dumps(cleaned_dict, indent=indent)
+        orjson is used for the default 2-space indent when installed. Its
+        output matches json.dumps byte for byte except that non-ASCII
+        characters are written as UTF-8 instead of being escaped, so that
+        case (and anything orjson cannot encode) goes through json.dumps.
+        """
+        if orjson is not None and indent == 2:
+            try:
+                output = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+            except TypeError:
+                pass
+            else:
+                if output.isascii():
+                    return output
+        
+        return json.dumps(data, indent=indent)
     
     @staticmethod
     def _remove_empty_fields(data):
         """
-        Recursively remove None values, empty lists, and empty dicts
+        Remove None values, empty lists, and empty dicts in place
         to produce cleaner output without noise
+        
+        Containers are collected in a single depth-first walk and then
+        cleaned in reverse order, so children are always pruned before
+        their parent decides whether they are empty.
         """
-        if isinstance(data, dict):
-            result = {}
-            for key, value in data.items():
-                cleaned_value = DIDGenerator._remove_empty_fields(value)
+        containers = []
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                containers.append(node)
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                containers.append(node)
+                stack.extend(node)
+        
+        for node in reversed(containers):
+            if isinstance(node, dict):
                 # Skip None, empty lists, and empty dicts
-                if cleaned_value is None:
-                    continue
-                if isinstance(cleaned_value, list) and len(cleaned_value) == 0:
-                    continue
-                if isinstance(cleaned_value, dict) and len(cleaned_value) == 0:
-                    continue
-                result[key] = cleaned_value
-            return result
-        elif isinstance(data, list):
-            # Clean list items and filter out None values
-            cleaned = [DIDGenerator._remove_empty_fields(item) for item in data]
-            return [item for item in cleaned if item is not None]
-        else:
-            return data
+                empty_keys = [
+                    key for key, value in node.items()
+                    if value is None or (isinstance(value, (list, dict)) and not value)
+                ]
+                for key in empty_keys:
+                    del node[key]
+            elif None in node:
+                # Filter out None list items
+                node[:] = [item for item in node if item is not None]
+        
+        return data
+
+
+def _generate_batch_in_worker(n: int, **options: Any) -> List[DIDGenerationResult]:
+    """
+    Process pool task for DIDGenerator.generate_many
+    
+    Builds a fresh generator (its own key manager, document builder and an
+    empty resolver) in the worker process, so the task only carries the
+    batch size and document options.
+    """
+    return DIDGenerator().generate_batch(n, **options)
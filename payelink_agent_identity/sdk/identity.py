@@ -1,9 +1,14 @@
 """
 Identity class - Primary API for agent identity management
 """
-from typing import Optional, List
+from typing import Optional, List, Union
 from .generator import DIDGenerator
 from .types import DIDDocument, ServiceEndpoint
+from ..crypto.keys import SecretBytes
+from ..utils.encoding import extract_public_key_from_did
+
+# Shared generator; DIDGenerator holds no per-identity state
+_DEFAULT_GENERATOR = DIDGenerator()
 
 
 class Identity:
@@ -23,12 +28,14 @@ class Identity:
         identity = Identity.resolve("did:key:z6Mk...")
     """
     
+    __slots__ = ("_did", "_document", "_public_key", "_private_key", "_key_type")
+    
     def __init__(
         self,
         did: str,
         document: DIDDocument,
         public_key: bytes,
-        private_key: Optional[bytes] = None,
+        private_key: Optional[Union[bytes, SecretBytes]] = None,
         key_type: str = "Ed25519"
     ):
         """
@@ -38,15 +45,18 @@ class Identity:
             did: The DID identifier
             document: The DID document
             public_key: Public key bytes
-            private_key: Private key bytes (optional, for new identities)
+            private_key: Private key bytes (optional, for new identities);
+                held as SecretBytes
             key_type: Type of cryptographic key
         """
+        if private_key is not None and not isinstance(private_key, SecretBytes):
+            private_key = SecretBytes(private_key)
+        
         self._did = did
         self._document = document
         self._public_key = public_key
         self._private_key = private_key
         self._key_type = key_type
-        self._generator = DIDGenerator()
     
     @property
     def did(self) -> str:
@@ -64,8 +74,13 @@ class Identity:
         return self._public_key
     
     @property
-    def private_key(self) -> Optional[bytes]:
-        """Private key bytes (None if not available)"""
+    def private_key(self) -> Optional[SecretBytes]:
+        """
+        Private key (None if not available)
+        
+        A SecretBytes buffer rather than bytes: pass bytes(identity.private_key)
+        to APIs that require bytes, such as PyNaCl's SigningKey.
+        """
         return self._private_key
     
     @property
@@ -101,13 +116,11 @@ class Identity:
             identity = Identity.create()
             print(identity.did)
         """
-        generator = DIDGenerator()
-        
         # For now, only support did:key method
         if method != "key":
             raise ValueError(f"Unsupported DID method: {method}. Only 'key' is currently supported.")
         
-        result = generator.generate(
+        result = _DEFAULT_GENERATOR.generate(
             key_type=key_type,
             verification_relationships=verification_relationships,
             services=services,
@@ -136,12 +149,10 @@ class Identity:
         Example:
             identity = Identity.resolve("did:key:z6MkhaXgBZDvotDkL5257faiztiGiC2QtKLGpbnnEGta2doK")
         """
-        generator = DIDGenerator()
-        document = generator.resolve(did)
+        document = _DEFAULT_GENERATOR.resolve(did)
         
         # Extract public key from DID for did:key method
         if did.startswith("did:key:"):
-            from ..utils.encoding import extract_public_key_from_did
             key_type, public_key = extract_public_key_from_did(did)
         else:
             raise ValueError(f"Cannot extract key from DID method: {did.split(':')[1]}")
@@ -176,8 +187,7 @@ class Identity:
         Returns:
             Identity instance (without private key)
         """
-        generator = DIDGenerator()
-        result = generator.generate_from_existing_key(
+        result = _DEFAULT_GENERATOR.generate_from_existing_key(
             public_key=public_key,
             key_type=key_type,
             verification_relationships=verification_relationships,
@@ -200,14 +210,12 @@ class Identity:
 # Add json() method to DIDDocument for convenience
 def _document_json(self, indent: int = 2) -> str:
     """Export DID document as JSON"""
-    generator = DIDGenerator()
-    return generator.export_json(self, indent=indent)
+    return _DEFAULT_GENERATOR.export_json(self, indent=indent)
 
 
 def _document_json_ld(self, indent: int = 2) -> str:
     """Export DID document as JSON-LD"""
-    generator = DIDGenerator()
-    return generator.export_json_ld(self, indent=indent)
+    return _DEFAULT_GENERATOR.export_json_ld(self, indent=indent)
 
 
 # Monkey-patch DIDDocument to add json() method
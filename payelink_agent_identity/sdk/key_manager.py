@@ -2,14 +2,35 @@
 Cryptographic key management for DIDs
 Spec reference: Section 5.2 - Verification Methods
 """
-from typing import Tuple
-from cryptography.hazmat.primitives.asymmetric.ed25519 import (
-    Ed25519PrivateKey,
-    Ed25519PublicKey
-)
-from cryptography.hazmat.primitives import serialization
+import functools
+import os
+from types import ModuleType
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from ..crypto.keys import KeyPair
+# The crypto backends are imported where they are used, so that code paths
+# which never touch key material (e.g. did:key resolution) do not pay for
+# loading them
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+
+from ..crypto.ed25519 import is_valid_point
+from ..crypto.keys import KeyPair, SecretBytes
+
+
+@functools.lru_cache(maxsize=None)
+def _nacl_signing() -> Optional[ModuleType]:
+    """
+    Return PyNaCl's signing module, or None if PyNaCl is not installed
+    
+    PyNaCl is the libsodium-backed Ed25519 implementation, installed with
+    the optional "fast" extra. The lookup is cached so a missing package
+    only costs one failed import.
+    """
+    try:
+        import nacl.signing
+    except ImportError:
+        return None
+    return nacl.signing
 
 
 class KeyManager:
@@ -31,54 +52,109 @@ class KeyManager:
         Ed25519 is recommended for its security and performance
         
         Returns:
-            KeyPair with 32-byte public and private keys
+            KeyPair with 32-byte public and private keys (the private key
+            is held in a SecretBytes buffer that is zeroed when released)
         """
-        # Generate private key
-        private_key = Ed25519PrivateKey.generate()
+        # Generate private key seed
+        return KeyManager._ed25519_keypair(os.urandom(32))
+    
+    @staticmethod
+    def generate_ed25519_keypair_batch(n: int) -> List[KeyPair]:
+        """
+        Generate n Ed25519 key pairs
         
-        # Get public key
-        public_key = private_key.public_key()
+        Entropy for the whole batch is drawn from the OS CSPRNG in a single
+        call and split into 32-byte private key seeds, instead of one draw
+        per key pair. The seeds are used as-is rather than derived from a
+        shared master seed, so the keys in a batch stay independent of each
+        other. The batch buffer is zeroed once the key pairs are built.
         
-        # Serialize to raw bytes
-        private_bytes = private_key.private_bytes(
-            encoding=serialization.Encoding.Raw,
-            format=serialization.PrivateFormat.Raw,
-            encryption_algorithm=serialization.NoEncryption()
-        )
+        Returns:
+            List of n KeyPairs
+        """
+        if n < 0:
+            raise ValueError(f"Batch size must be non-negative, got {n}")
         
-        public_bytes = public_key.public_bytes(
-            encoding=serialization.Encoding.Raw,
-            format=serialization.PublicFormat.Raw
-        )
+        seeds = SecretBytes(os.urandom(32 * n))
+        try:
+            with memoryview(seeds) as view:
+                return [
+                    KeyManager._ed25519_keypair(bytes(view[offset:offset + 32]))
+                    for offset in range(0, 32 * n, 32)
+                ]
+        finally:
+            seeds.zeroize()
+    
+    @staticmethod
+    def _ed25519_keypair(seed: bytes) -> KeyPair:
+        """
+        Derive an Ed25519 KeyPair from a 32-byte private key seed
+        
+        Uses libsodium (PyNaCl) when available, which is faster than the
+        OpenSSL backend of the cryptography package. Both treat the raw
+        private key as the RFC 8032 seed, so the resulting keys are identical.
+        """
+        signing = _nacl_signing()
+        if signing is not None:
+            public_bytes = signing.SigningKey(seed).verify_key.encode()
+        else:
+            from cryptography.hazmat.primitives import serialization
+            from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+            
+            private_key = Ed25519PrivateKey.from_private_bytes(seed)
+            public_bytes = private_key.public_key().public_bytes(
+                encoding=serialization.Encoding.Raw,
+                format=serialization.PublicFormat.Raw
+            )
         
         return KeyPair(
             public_key=public_bytes,
-            private_key=private_bytes,
+            private_key=SecretBytes(seed),
             key_type="Ed25519"
         )
     
     @staticmethod
-    def public_key_from_bytes(public_bytes: bytes, key_type: str = "Ed25519") -> Ed25519PublicKey:
+    def public_key_from_bytes(public_bytes: bytes, key_type: str = "Ed25519") -> "Ed25519PublicKey":
         """
         Reconstruct public key from bytes
         """
         if key_type == "Ed25519":
+            from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+            
             return Ed25519PublicKey.from_public_bytes(public_bytes)
         else:
             raise ValueError(f"Unsupported key type: {key_type}")
     
     @staticmethod
-    def validate_public_key(public_key: bytes, key_type: str = "Ed25519") -> bool:
+    def validate_public_key(
+        public_key: bytes,
+        key_type: str = "Ed25519",
+        strict: bool = False
+    ) -> bool:
         """
         Validate that public key is well-formed
+        
+        By default only the key length is checked, which is enough for keys
+        that were just generated or decoded from a well-formed DID. Pass
+        strict=True for keys received from untrusted sources: the key must
+        then also be a canonical encoding of a curve point in the
+        prime-order subgroup (small-order and mixed-order points are
+        rejected).
         """
         if key_type == "Ed25519":
             # Ed25519 public keys are 32 bytes
             if len(public_key) != 32:
                 return False
-            try:
-                Ed25519PublicKey.from_public_bytes(public_key)
+            if not strict:
                 return True
-            except Exception:
-                return False
+            
+            # libsodium (PyNaCl) when available, otherwise the equivalent
+            # pure-Python check. The cryptography package does not validate
+            # points when loading a public key, so it cannot be used here.
+            if _nacl_signing() is not None:
+                from nacl.bindings import crypto_core_ed25519_is_valid_point
+                
+                return crypto_core_ed25519_is_valid_point(bytes(public_key))
+            
+            return is_valid_point(public_key)
         return False
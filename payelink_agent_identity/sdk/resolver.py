@@ -2,13 +2,56 @@
 DID Resolution for did:key method
 Spec reference: Section 7.1 - DID Resolution
 """
-from typing import Dict, Any
+import re
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, List
 
 from ..utils.encoding import extract_public_key_from_did
-from ..utils.validation import validate_did_syntax
+from ..utils.validation import MAX_DID_LENGTH, validate_did_syntax
 from .document_builder import DIDDocumentBuilder
 from .types import DIDDocument, DIDResolutionResult
-from ..utils.constants import VR_AUTHENTICATION, VR_ASSERTION
+from ..utils.constants import DID_KEY_PREFIX, VR_AUTHENTICATION, VR_ASSERTION
+
+# Default number of resolved documents a resolver keeps in memory
+RESOLUTION_CACHE_SIZE = 1024
+
+# A did:key DID with a base58btc multibase key; anything matching this also
+# passes the generic DID syntax check
+_DID_KEY_RE = re.compile(r"did:key:z[1-9A-HJ-NP-Za-km-z]+")
+
+
+def _detached_copy(document: DIDDocument) -> DIDDocument:
+    """
+    Copy a cached document so the caller cannot affect the cache
+    
+    Documents are frozen, but only shallowly: their list fields can still
+    be changed in place. Each copy gets its own lists (and its own export
+    memo); the list items are frozen models or strings and are shared.
+    """
+    return document.model_copy(update={
+        name: list(value)
+        for name, value in document.__dict__.items()
+        if isinstance(value, list)
+    })
+
+
+class InvalidDIDSyntaxError(ValueError):
+    """The DID does not conform to DID syntax (Spec 3.1)"""
+    
+    # DID resolution metadata error code (Spec 7.1.2)
+    error = "invalidDid"
+
+
+class UnsupportedMethodError(ValueError):
+    """The DID uses a method other than did:key"""
+    
+    error = "methodNotSupported"
+
+
+class PublicKeyExtractionError(ValueError):
+    """The public key could not be decoded from the did:key identifier"""
+    
+    error = "notFound"
 
 
 class DIDKeyResolver:
@@ -19,11 +62,22 @@ class DIDKeyResolver:
     1. Parse the DID to extract public key
     2. Generate DID document from public key
     
+    A did:key document is a pure function of the DID string, so each
+    resolver keeps the most recently resolved documents in a bounded LRU
+    cache and never needs to invalidate it.
+    
     Spec: Section 7.1 - DID Resolution
     """
     
-    def __init__(self):
+    def __init__(self, cache_size: int = RESOLUTION_CACHE_SIZE):
+        """
+        Args:
+            cache_size: Maximum number of resolved documents to keep
+                (0 disables caching)
+        """
         self.document_builder = DIDDocumentBuilder()
+        self._doc_cache: "OrderedDict[str, DIDDocument]" = OrderedDict()
+        self._max = cache_size
     
     def resolve(self, did: str) -> DIDDocument:
         """
@@ -36,32 +90,91 @@ class DIDKeyResolver:
             DIDDocument
             
         Raises:
-            ValueError: If DID is invalid or unsupported
+            InvalidDIDSyntaxError: If the DID is not syntactically valid
+            UnsupportedMethodError: If the DID method is not did:key
+            PublicKeyExtractionError: If the key cannot be decoded from the DID
         """
-        # Validate DID syntax (Spec 3.1)
-        if not validate_did_syntax(did):
-            raise ValueError(f"Invalid DID syntax: {did}")
+        # Common case: a well-formed did:key DID, checked with one match.
+        # Everything else takes the general checks for a precise error.
+        if len(did) > MAX_DID_LENGTH or _DID_KEY_RE.fullmatch(did) is None:
+            # Validate DID syntax (Spec 3.1)
+            if not validate_did_syntax(did):
+                raise InvalidDIDSyntaxError(f"Invalid DID syntax: {did}")
+            
+            # Only support did:key for now
+            if not did.startswith(DID_KEY_PREFIX):
+                raise UnsupportedMethodError("Unsupported DID method. Only did:key is supported.")
         
-        # Only support did:key for now
-        if not did.startswith("did:key:"):
-            raise ValueError(f"Unsupported DID method. Only did:key is supported.")
+        # Cached documents are never handed out directly, only detached copies
+        document = self._doc_cache.get(did)
+        if document is not None:
+            try:
+                self._doc_cache.move_to_end(did)
+            except KeyError:
+                # Evicted by another thread since the lookup; the document
+                # itself is still valid
+                pass
+            return _detached_copy(document)
         
         # Extract public key from DID
         try:
             key_type, public_key = extract_public_key_from_did(did)
         except Exception as e:
-            raise ValueError(f"Failed to extract public key from DID: {e}")
+            raise PublicKeyExtractionError(f"Failed to extract public key from DID: {e}")
         
         # Build DID document
         document = self.document_builder.build(
             did=did,
             public_key=public_key,
             key_type=key_type,
-            verification_relationships=[VR_AUTHENTICATION, VR_ASSERTION]
+            verification_relationships=[VR_AUTHENTICATION, VR_ASSERTION],
+            multibase_key=did[len(DID_KEY_PREFIX):]
         )
         
+        if self._max > 0:
+            self._doc_cache[did] = document
+            if len(self._doc_cache) > self._max:
+                try:
+                    self._doc_cache.popitem(last=False)
+                except KeyError:
+                    # Another thread emptied the cache concurrently
+                    pass
+            document = _detached_copy(document)
+        
         return document
     
+    def resolve_many(self, dids: Iterable[str]) -> List[DIDDocument]:
+        """
+        Resolve several did:key DIDs at once
+        
+        Equivalent to calling resolve() for each DID, except that a DID
+        repeated within the batch is only resolved once, even when the
+        resolver cache is disabled or smaller than the batch. Repeats still
+        get their own detached copy of the document.
+        
+        Args:
+            dids: The DIDs to resolve
+            
+        Returns:
+            List of DIDDocuments, in the same order as dids
+            
+        Raises:
+            ValueError: If any DID is invalid or unsupported
+        """
+        resolve = self.resolve
+        resolved: Dict[str, DIDDocument] = {}
+        documents = []
+        
+        for did in dids:
+            document = resolved.get(did)
+            if document is None:
+                document = resolved[did] = resolve(did)
+            else:
+                document = _detached_copy(document)
+            documents.append(document)
+        
+        return documents
+    
     def resolve_with_metadata(self, did: str) -> DIDResolutionResult:
         """
         Resolve with full metadata structure
@@ -71,7 +184,8 @@ class DIDKeyResolver:
         try:
             document = self.resolve(did)
             
-            return DIDResolutionResult(
+            # The document was built internally, so skip re-validating it
+            return DIDResolutionResult.model_construct(
                 didResolutionMetadata={
                     "contentType": "application/did+ld+json"
                 },
@@ -80,9 +194,9 @@ class DIDKeyResolver:
             )
         except Exception as e:
             # Return error in metadata (Spec 7.1.2)
-            return DIDResolutionResult(
+            return DIDResolutionResult.model_construct(
                 didResolutionMetadata={
-                    "error": "notFound" if "extract" in str(e) else "invalidDid",
+                    "error": getattr(e, "error", "invalidDid"),
                     "errorMessage": str(e)
                 },
                 didDocument=None,
@@ -2,8 +2,12 @@
 DID document data types following W3C DID Core v1.0
 Spec reference: https://www.w3.org/TR/did-core/#data-model
 """
-from typing import List, Optional, Union, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+import functools
+from typing import List, Optional, Tuple, Type, TypeVar, Union, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+
+from ..crypto.keys import SecretBytes
+from ..utils.constants import DID_CONTEXT_V1
 
 
 class VerificationMethod(BaseModel):
@@ -24,8 +28,9 @@ class VerificationMethod(BaseModel):
             raise ValueError(f"Invalid verification method id: {v}")
         return v
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "id": "did:key:z6MkhaXgBZDvotDkL5257faiztiGiC2QtKLGpbnnEGta2doK#z6MkhaXgBZDvotDkL5257faiztiGiC2QtKLGpbnnEGta2doK",
                 "type": "Ed25519VerificationKey2020",
@@ -33,6 +38,7 @@ class VerificationMethod(BaseModel):
                 "publicKeyMultibase": "z6MkhaXgBZDvotDkL5257faiztiGiC2QtKLGpbnnEGta2doK"
             }
         }
+    )
 
 
 class ServiceEndpoint(BaseModel):
@@ -55,14 +61,23 @@ class ServiceEndpoint(BaseModel):
                 raise ValueError(f"Invalid service endpoint URL: {v}")
         return v
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "id": "did:key:z6Mk...#agent-inbox",
                 "type": "MessagingService",
                 "serviceEndpoint": "https://agent.example.com/inbox"
             }
         }
+    )
+
+
+def _check_did(v: str) -> str:
+    """Ensure a DID document id conforms to DID syntax (Spec 3.1)"""
+    if not v.startswith('did:'):
+        raise ValueError(f"Invalid DID: {v}")
+    return v
 
 
 class DIDDocument(BaseModel):
@@ -72,7 +87,7 @@ class DIDDocument(BaseModel):
     """
     context: Union[str, List[Union[str, Dict[str, Any]]]] = Field(
         alias="@context",
-        default=["https://www.w3.org/ns/did/v1"]
+        default_factory=lambda: [DID_CONTEXT_V1]
     )
     id: str = Field(..., description="The DID subject (Spec 5.1.1)")
     alsoKnownAs: Optional[List[str]] = Field(None, description="Alternative identifiers (Spec 5.1.3)")
@@ -85,20 +100,44 @@ class DIDDocument(BaseModel):
     capabilityDelegation: Optional[List[Union[str, VerificationMethod]]] = Field(None, description="Capability delegation (Spec 5.3.5)")
     service: Optional[List[ServiceEndpoint]] = Field(None, description="Services (Spec 5.4)")
     
+    # Serialized output memoized by the export helpers, keyed by indent, with
+    # the field snapshot it was produced from (see DIDGenerator._serialize)
+    _export_cache: Dict[Optional[int], Tuple[tuple, str]] = PrivateAttr(default_factory=dict)
+    
     @field_validator('id')
     @classmethod
     def validate_did(cls, v: str) -> str:
         """Ensure id conforms to DID syntax (Spec 3.1)"""
-        if not v.startswith('did:'):
-            raise ValueError(f"Invalid DID: {v}")
-        return v
+        return _check_did(v)
     
-    class Config:
-        populate_by_name = True  # Allow using '@context' as field name
-        json_encoders = {
-            # Ensure None values are excluded
-        }
-        json_schema_extra = {
+    def __eq__(self, other: Any) -> bool:
+        # BaseModel.__eq__ also compares private attributes, but the export
+        # memo is a cache rather than document state, so compare fields only
+        if isinstance(other, DIDDocument):
+            return (
+                type(self) is type(other)
+                and self.__dict__ == other.__dict__
+                and (self.__pydantic_extra__ or {}) == (other.__pydantic_extra__ or {})
+            )
+        return super().__eq__(other)
+    
+    def model_copy(
+        self,
+        *,
+        update: Optional[Dict[str, Any]] = None,
+        deep: bool = False
+    ) -> "DIDDocument":
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            # Changed fields invalidate memoized output, which the copy
+            # would otherwise share with this document
+            copy._export_cache = {}
+        return copy
+    
+    model_config = ConfigDict(
+        populate_by_name=True,  # Allow using '@context' as field name
+        frozen=True,  # Fields cannot be reassigned (lists are still mutable)
+        json_schema_extra={
             "example": {
                 "@context": [
                     "https://www.w3.org/ns/did/v1",
@@ -116,6 +155,7 @@ class DIDDocument(BaseModel):
                 ]
             }
         }
+    )
 
 
 class DIDResolutionResult(BaseModel):
@@ -135,8 +175,47 @@ class DIDGenerationResult(BaseModel):
     did: str
     document: DIDDocument
     public_key: bytes
-    private_key: bytes  # WARNING: Handle with extreme care!
+    private_key: SecretBytes  # WARNING: Handle with extreme care!
     key_type: str
     
-    class Config:
-        arbitrary_types_allowed = True
+    @field_validator('private_key', mode='before')
+    @classmethod
+    def wrap_private_key(cls, v: Any) -> Any:
+        """Accept plain bytes, held as SecretBytes like generated keys"""
+        if isinstance(v, (bytes, bytearray)) and not isinstance(v, SecretBytes):
+            return SecretBytes(v)
+        return v
+    
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+_Model = TypeVar("_Model", bound=BaseModel)
+
+
+@functools.lru_cache(maxsize=None)
+def _unset_fields(model: Type[BaseModel]) -> Dict[str, None]:
+    """Map every field of a model to None"""
+    return dict.fromkeys(model.model_fields)
+
+
+def _construct(model: Type[_Model], **values: Any) -> _Model:
+    """
+    Create a model instance from trusted values without validation
+    
+    A leaner equivalent of model.model_construct(**values) for the document
+    builder: values are keyed by field name (not alias) and fields that are
+    not given are set to None, so callers must pass every field whose
+    default is not None. Avoids model_construct's per-field default lookup,
+    which dominated document build time.
+    """
+    instance = model.__new__(model)
+    object.__setattr__(instance, '__dict__', {**_unset_fields(model), **values})
+    object.__setattr__(instance, '__pydantic_fields_set__', set(values))
+    object.__setattr__(instance, '__pydantic_extra__', None)
+    object.__setattr__(instance, '__pydantic_private__', None)
+    
+    # Initializes private attributes, as model_construct does
+    if model.__pydantic_post_init__:
+        instance.model_post_init(None)
+    
+    return instance
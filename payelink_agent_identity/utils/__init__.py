@@ -5,6 +5,7 @@ from .encoding import (
     MultibaseEncoder,
     MulticodecEncoder,
     create_did_key_identifier,
+    create_did_key_identifiers,
     extract_public_key_from_did,
 )
 from .validation import (
@@ -18,6 +19,7 @@ __all__ = [
     "MultibaseEncoder",
     "MulticodecEncoder",
     "create_did_key_identifier",
+    "create_did_key_identifiers",
     "extract_public_key_from_did",
     "validate_did_syntax",
     "parse_did",
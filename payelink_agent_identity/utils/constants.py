@@ -7,11 +7,15 @@ DID_CONTEXT_V1 = "https://www.w3.org/ns/did/v1"
 ED25519_2020_CONTEXT = "https://w3id.org/security/suites/ed25519-2020/v1"
 JWS_2020_CONTEXT = "https://w3id.org/security/suites/jws-2020/v1"
 
+# did:key method prefix; the rest of a did:key DID is the multibase-encoded key
+DID_KEY_PREFIX = "did:key:"
+
 # Multicodec prefixes (for did:key)
 # Reference: https://github.com/multiformats/multicodec
 MULTICODEC_ED25519_PUB = 0xED  # Ed25519 public key
 MULTICODEC_ED25519_PRIV = 0x1300  # Ed25519 private key (for reference, never expose)
 MULTICODEC_X25519_PUB = 0xEC  # X25519 public key (key agreement)
+MULTICODEC_ED25519_PUB_BYTES = bytes([MULTICODEC_ED25519_PUB])  # Encoded prefix
 
 # Multibase prefixes
 # Reference: https://github.com/multiformats/multibase
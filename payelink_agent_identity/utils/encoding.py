@@ -4,10 +4,79 @@ Spec reference: Section 3.1 - DID Syntax
 
 did:key format: did:key:<multibase-encoded-multicodec-public-key>
 """
-import base58
-from typing import Tuple
+import functools
+from typing import Iterable, List, Tuple
 
-from .constants import MULTICODEC_ED25519_PUB, MULTIBASE_BASE58BTC
+try:
+    # Rust-backed base58 codec (optional, installed with the "fast" extra)
+    import based58
+except ImportError:
+    based58 = None
+
+from .constants import (
+    DID_KEY_PREFIX,
+    MULTICODEC_ED25519_PUB,
+    MULTICODEC_ED25519_PUB_BYTES,
+    MULTIBASE_BASE58BTC,
+)
+
+# base58btc alphabet (Bitcoin)
+_B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+# ASCII code -> base58 digit value, 0xFF for characters outside the alphabet
+_B58_INV = bytes(
+    _B58_ALPHABET.find(chr(code)) if chr(code) in _B58_ALPHABET else 0xFF
+    for code in range(256)
+)
+
+# Every two-digit base58 string, indexed by its value, so the encoder
+# produces two characters per big-integer division
+_B58_PAIRS = tuple(high + low for high in _B58_ALPHABET for low in _B58_ALPHABET)
+
+
+def _b58encode(data: bytes) -> str:
+    """
+    Encode bytes as base58btc (used when based58 is not installed)
+    
+    The payload is converted to one integer and divided by 58**2 per step,
+    e.g. 23 divisions for a 33-byte did:key payload instead of 46.
+    """
+    number = int.from_bytes(data, 'big')
+    
+    pairs = []
+    while number:
+        number, remainder = divmod(number, 3364)
+        pairs.append(_B58_PAIRS[remainder])
+    
+    # Each leading zero byte is encoded as a leading '1' (the zero digit)
+    zeros = len(data) - len(data.lstrip(b'\0'))
+    
+    return '1' * zeros + ''.join(reversed(pairs)).lstrip('1')
+
+
+def _b58decode(encoded: str) -> bytes:
+    """
+    Decode a base58btc string (used when based58 is not installed)
+    
+    All characters are mapped to digit values with one translate() call
+    through _B58_INV, so the loop only does the arithmetic.
+    """
+    try:
+        digits = encoded.encode('ascii').translate(_B58_INV)
+    except UnicodeEncodeError as e:
+        raise ValueError(f"Invalid base58 character: {e.object[e.start]!r}") from None
+    
+    if 0xFF in digits:
+        raise ValueError(f"Invalid base58 character: {encoded[digits.index(0xFF)]!r}")
+    
+    number = 0
+    for digit in digits:
+        number = number * 58 + digit
+    
+    # Each leading '1' is a leading zero byte
+    zeros = len(encoded) - len(encoded.lstrip('1'))
+    
+    return b'\0' * zeros + number.to_bytes((number.bit_length() + 7) // 8, 'big')
 
 
 class MultibaseEncoder:
@@ -31,7 +100,10 @@ class MultibaseEncoder:
             Multibase-encoded string with prefix
         """
         if encoding == 'base58btc':
-            encoded = base58.b58encode(data).decode('ascii')
+            if based58 is not None:
+                encoded = based58.b58encode(data).decode('ascii')
+            else:
+                encoded = _b58encode(data)
             return f"{MULTIBASE_BASE58BTC}{encoded}"
         else:
             raise ValueError(f"Unsupported encoding: {encoding}")
@@ -44,14 +116,29 @@ class MultibaseEncoder:
         Returns:
             Tuple of (encoding_type, decoded_bytes)
         """
-        if not multibase_string:
+        return MultibaseEncoder.decode_slice(multibase_string, 0)
+    
+    @staticmethod
+    def decode_slice(s: str, offset: int) -> Tuple[str, bytes]:
+        """
+        Decode the multibase string that starts at s[offset]
+        
+        Same as decode(s[offset:]) without copying the string first.
+        
+        Returns:
+            Tuple of (encoding_type, decoded_bytes)
+        """
+        if len(s) <= offset:
             raise ValueError("Empty multibase string")
         
-        prefix = multibase_string[0]
-        encoded = multibase_string[1:]
+        prefix = s[offset]
+        encoded = s[offset + 1:]
         
         if prefix == MULTIBASE_BASE58BTC:
-            decoded = base58.b58decode(encoded)
+            if based58 is not None:
+                decoded = based58.b58decode(encoded.encode('ascii'))
+            else:
+                decoded = _b58decode(encoded)
             return ('base58btc', decoded)
         else:
             raise ValueError(f"Unsupported multibase prefix: {prefix}")
@@ -79,8 +166,7 @@ class MulticodecEncoder:
         """
         if key_type == "Ed25519":
             # Ed25519 public key multicodec is 0xed
-            prefix = bytes([MULTICODEC_ED25519_PUB])
-            return prefix + public_key
+            return MULTICODEC_ED25519_PUB_BYTES + public_key
         else:
             raise ValueError(f"Unsupported key type: {key_type}")
     
@@ -129,16 +215,51 @@ def create_did_key_identifier(public_key: bytes, key_type: str = "Ed25519") -> s
     multibase_key = MultibaseEncoder.encode(multicodec_key)
     
     # Step 3: Construct DID
-    did = f"did:key:{multibase_key}"
+    return DID_KEY_PREFIX + multibase_key
+
+
+def create_did_key_identifiers(
+    public_keys: Iterable[bytes],
+    key_type: str = "Ed25519"
+) -> List[str]:
+    """
+    Create did:key identifiers for many public keys at once
+    
+    Equivalent to calling create_did_key_identifier for each key, but the
+    key type and base58 codec are resolved once for the whole batch.
+    
+    Args:
+        public_keys: Raw public key bytes (32 bytes each for Ed25519)
+        key_type: Type of the keys
+        
+    Returns:
+        List of DID strings, in the same order as public_keys
+    """
+    if key_type != "Ed25519":
+        raise ValueError(f"Unsupported key type: {key_type}")
+    
+    did_prefix = DID_KEY_PREFIX + MULTIBASE_BASE58BTC
     
-    return did
+    if based58 is not None:
+        b58encode = based58.b58encode
+        return [
+            did_prefix + b58encode(MULTICODEC_ED25519_PUB_BYTES + public_key).decode('ascii')
+            for public_key in public_keys
+        ]
+    
+    return [
+        did_prefix + _b58encode(MULTICODEC_ED25519_PUB_BYTES + public_key)
+        for public_key in public_keys
+    ]
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_public_key_from_did(did: str) -> Tuple[str, bytes]:
     """
     Extract public key from did:key identifier
     
-    This enables resolution of did:key DIDs
+    This enables resolution of did:key DIDs. Results are memoized since a
+    did:key identifier always maps to the same key.
     
     Args:
         did: DID string (e.g., did:key:z6Mk...)
@@ -146,14 +267,11 @@ def extract_public_key_from_did(did: str) -> Tuple[str, bytes]:
     Returns:
         Tuple of (key_type, public_key_bytes)
     """
-    if not did.startswith("did:key:"):
+    if not did.startswith(DID_KEY_PREFIX):
         raise ValueError(f"Invalid did:key identifier: {did}")
     
-    # Extract multibase-encoded portion
-    multibase_key = did[8:]  # Remove "did:key:" prefix
-    
-    # Decode multibase
-    encoding, multicodec_key = MultibaseEncoder.decode(multibase_key)
+    # Decode the multibase-encoded portion after the "did:key:" prefix
+    encoding, multicodec_key = MultibaseEncoder.decode_slice(did, len(DID_KEY_PREFIX))
     
     # Decode multicodec
     key_type, public_key = MulticodecEncoder.decode_public_key(multicodec_key)
@@ -5,6 +5,14 @@ Spec reference: Section 3 - Identifier
 import re
 from typing import Tuple
 
+# Basic regex for DID syntax, matched against the whole string
+# More permissive than full ABNF but catches major issues
+_DID_RE = re.compile(r'did:[a-z0-9]+:[a-zA-Z0-9._\-:]+')
+
+# Longest DID or DID URL accepted, so oversized (possibly adversarial)
+# inputs are rejected before any parsing work
+MAX_DID_LENGTH = 2048
+
 
 def validate_did_syntax(did: str) -> bool:
     """
@@ -13,11 +21,11 @@ def validate_did_syntax(did: str) -> bool:
     Spec 3.1: DID Syntax ABNF
     did = "did:" method-name ":" method-specific-id
     """
-    # Basic regex for DID syntax
-    # More permissive than full ABNF but catches major issues
-    did_pattern = r'^did:[a-z0-9]+:[a-zA-Z0-9._\-:]+$'
+    # Cheap rejection of anything that is not a DID before running the regex
+    if not did.startswith('did:') or len(did) > MAX_DID_LENGTH:
+        return False
     
-    return bool(re.match(did_pattern, did))
+    return _DID_RE.fullmatch(did) is not None
 
 
 def parse_did(did: str) -> Tuple[str, str]:
@@ -30,12 +38,13 @@ def parse_did(did: str) -> Tuple[str, str]:
     if not did.startswith('did:'):
         raise ValueError(f"Invalid DID: {did}")
     
-    parts = did.split(':', 2)
+    _, _, rest = did.partition(':')
+    method, separator, method_specific_id = rest.partition(':')
     
-    if len(parts) < 3:
+    if not separator:
         raise ValueError(f"Invalid DID structure: {did}")
     
-    return (parts[1], parts[2])
+    return (method, method_specific_id)
 
 
 def validate_did_url(did_url: str) -> bool:
@@ -45,8 +54,11 @@ def validate_did_url(did_url: str) -> bool:
     Spec 3.2: DID URL may include path, query, fragment
     did-url = did path-abempty [ "?" query ] [ "#" fragment ]
     """
+    if not did_url.startswith('did:') or len(did_url) > MAX_DID_LENGTH:
+        return False
+    
     # Split on first occurrence of ?, #, or /
-    base_did = did_url.split('?')[0].split('#')[0].split('/')[0]
+    base_did = did_url.partition('?')[0].partition('#')[0].partition('/')[0]
     
     return validate_did_syntax(base_did)
 
@@ -57,6 +69,9 @@ def validate_verification_method_id(vm_id: str) -> bool:
     
     Spec 5.2: id must be a DID URL
     """
+    if len(vm_id) > MAX_DID_LENGTH:
+        return False
+    
     # Can be relative (#key-1) or absolute (did:example:123#key-1)
     if vm_id.startswith('#'):
         return True
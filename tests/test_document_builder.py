@@ -0,0 +1,125 @@
+"""
+Tests for DIDDocumentBuilder and its lean model constructor
+Spec reference: Section 5 - Core Properties
+"""
+import pytest
+
+from payelink_agent_identity import DIDGenerator
+from payelink_agent_identity.sdk.document_builder import DIDDocumentBuilder
+from payelink_agent_identity.sdk.types import (
+    DIDDocument,
+    ServiceEndpoint,
+    VerificationMethod,
+    _construct,
+)
+from payelink_agent_identity.utils.constants import DID_CONTEXT_V1
+
+DID = "did:key:z6MkhaXgBZDvotDkL5257faiztiGiC2QtKLGpbnnEGta2doK"
+VM_ID = DID + "#" + DID[len("did:key:"):]
+
+
+def _assert_same_instance_state(constructed, expected):
+    """Compare everything model_construct sets up, private attributes included"""
+    assert type(constructed) is type(expected)
+    assert constructed.__dict__ == expected.__dict__
+    assert constructed.model_fields_set == expected.model_fields_set
+    assert constructed.__pydantic_extra__ == expected.__pydantic_extra__
+    assert constructed.__pydantic_private__ == expected.__pydantic_private__
+    assert constructed == expected
+    assert constructed.model_dump() == expected.model_dump()
+
+
+def _set_values(instance):
+    """The values a model instance was constructed with"""
+    return {name: instance.__dict__[name] for name in instance.model_fields_set}
+
+
+VERIFICATION_METHOD_VALUES = [
+    dict(
+        id=VM_ID,
+        type="Ed25519VerificationKey2020",
+        controller=DID,
+        publicKeyMultibase=DID[len("did:key:"):],
+    ),
+    dict(id=VM_ID, type="JsonWebKey2020", controller=DID, publicKeyJwk={"kty": "OKP"}),
+]
+
+DOCUMENT_VALUES = [
+    dict(context=[DID_CONTEXT_V1], id=DID),
+    dict(
+        context=[DID_CONTEXT_V1],
+        id=DID,
+        verificationMethod=[_construct(VerificationMethod, **VERIFICATION_METHOD_VALUES[0])],
+        authentication=[VM_ID],
+        assertionMethod=[VM_ID],
+        alsoKnownAs=["https://agent.example.com"],
+        controller=DID,
+        service=[
+            ServiceEndpoint(id=DID + "#inbox", type="Inbox", serviceEndpoint="https://a.example")
+        ],
+    ),
+]
+
+
+class TestConstruct:
+    """_construct must match model_construct for the values the builder passes"""
+
+    @pytest.mark.parametrize("values", VERIFICATION_METHOD_VALUES)
+    def test_verification_method(self, values):
+        _assert_same_instance_state(
+            _construct(VerificationMethod, **values),
+            VerificationMethod.model_construct(**values),
+        )
+
+    @pytest.mark.parametrize("values", DOCUMENT_VALUES)
+    def test_did_document(self, values):
+        constructed = _construct(DIDDocument, **values)
+
+        _assert_same_instance_state(constructed, DIDDocument.model_construct(**values))
+        assert constructed._export_cache == {}
+
+    def test_only_context_needs_an_explicit_value(self):
+        # _construct sets omitted fields to None, so a new field with another
+        # default must be passed explicitly by the builder
+        for model, expected in ((DIDDocument, {"context"}), (VerificationMethod, set())):
+            non_none_defaults = {
+                name for name, field in model.model_fields.items()
+                if not field.is_required()
+                and field.get_default(call_default_factory=True) is not None
+            }
+            assert non_none_defaults == expected
+
+    def test_export_memo_is_per_instance(self):
+        first = _construct(DIDDocument, **DOCUMENT_VALUES[0])
+        second = _construct(DIDDocument, **DOCUMENT_VALUES[0])
+        first.json()
+
+        assert first._export_cache
+        assert second._export_cache == {}
+
+    def test_built_documents(self):
+        result = DIDGenerator().generate(
+            services=[
+                {"id": DID + "#inbox", "type": "Inbox", "serviceEndpoint": "https://a.example"}
+            ],
+            also_known_as=["https://agent.example.com"],
+        )
+        document = result.document
+        method = document.verificationMethod[0]
+
+        _assert_same_instance_state(
+            document, DIDDocument.model_construct(**_set_values(document))
+        )
+        _assert_same_instance_state(
+            method, VerificationMethod.model_construct(**_set_values(method))
+        )
+
+    def test_built_documents_pass_validation(self):
+        document = DIDDocumentBuilder().build(
+            did=DID,
+            public_key=bytes(32),
+            also_known_as=["https://agent.example.com"],
+            controller=[DID],
+        )
+
+        assert DIDDocument.model_validate(document.model_dump()) == document
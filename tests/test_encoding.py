@@ -0,0 +1,137 @@
+"""
+Tests for the base58btc / multibase codec
+Spec reference: Section 3.1 - DID Syntax
+"""
+import os
+
+import pytest
+
+from payelink_agent_identity.utils import encoding
+from payelink_agent_identity.utils.encoding import (
+    MultibaseEncoder,
+    _b58decode,
+    _b58encode,
+    create_did_key_identifier,
+    create_did_key_identifiers,
+    extract_public_key_from_did,
+)
+
+# Known base58btc vectors (Bitcoin alphabet)
+VECTORS = [
+    (b"", ""),
+    (b"\x00", "1"),
+    (b"\x00\x00\x00", "111"),
+    (b"\x00\x00\x01", "112"),
+    (b"\x01", "2"),
+    (b"\x39", "z"),
+    (b"\x3a", "21"),
+    (b"hello world", "StV1DL6CwTryKyV"),
+    (b"\x00\x00hello world", "11StV1DL6CwTryKyV"),
+    (b"\xff" * 4, "7YXq9G"),
+]
+
+INVALID = ["0", "O", "I", "l", " ", "é", "abc0", "z6Mk\n", "1☃"]
+
+
+@pytest.fixture(params=["based58", "pure-python"])
+def codec(request, monkeypatch):
+    """Run MultibaseEncoder tests with and without the optional based58 backend"""
+    if request.param == "based58":
+        if encoding.based58 is None:
+            pytest.skip("based58 is not installed")
+    else:
+        monkeypatch.setattr(encoding, "based58", None)
+    return request.param
+
+
+class TestBase58:
+    """Pure-Python fallback codec"""
+
+    @pytest.mark.parametrize("raw, encoded", VECTORS)
+    def test_known_vectors(self, raw, encoded):
+        assert _b58encode(raw) == encoded
+        assert _b58decode(encoded) == raw
+
+    @pytest.mark.parametrize("size", [1, 2, 31, 32, 33, 64, 257])
+    def test_round_trip_random(self, size):
+        for _ in range(50):
+            data = os.urandom(size)
+            assert _b58decode(_b58encode(data)) == data
+
+    @pytest.mark.parametrize("zeros", range(5))
+    def test_leading_zero_bytes_map_to_leading_ones(self, zeros):
+        data = b"\x00" * zeros + b"\x01\x02\x03"
+        encoded = _b58encode(data)
+
+        assert encoded.startswith("1" * zeros)
+        assert not encoded[zeros:].startswith("1")
+        assert _b58decode(encoded) == data
+
+    @pytest.mark.parametrize("zeros", range(1, 5))
+    def test_all_zero_input(self, zeros):
+        assert _b58encode(b"\x00" * zeros) == "1" * zeros
+        assert _b58decode("1" * zeros) == b"\x00" * zeros
+
+    def test_empty(self):
+        assert _b58encode(b"") == ""
+        assert _b58decode("") == b""
+
+    @pytest.mark.parametrize("text", INVALID)
+    def test_invalid_characters(self, text):
+        with pytest.raises(ValueError, match="Invalid base58 character"):
+            _b58decode(text)
+
+
+class TestMultibaseEncoder:
+    """Multibase wrapper, against both base58 backends"""
+
+    @pytest.mark.parametrize("raw, encoded", VECTORS)
+    def test_known_vectors(self, codec, raw, encoded):
+        assert MultibaseEncoder.encode(raw) == "z" + encoded
+        assert MultibaseEncoder.decode("z" + encoded) == ("base58btc", raw)
+
+    def test_round_trip_random(self, codec):
+        for size in (1, 32, 33, 100):
+            data = b"\x00" * (size % 3) + os.urandom(size)
+            assert MultibaseEncoder.decode(MultibaseEncoder.encode(data)) == ("base58btc", data)
+
+    def test_decode_slice(self, codec):
+        assert MultibaseEncoder.decode_slice("did:key:zStV1DL6CwTryKyV", 8) == (
+            "base58btc",
+            b"hello world",
+        )
+
+    @pytest.mark.parametrize("text", INVALID)
+    def test_invalid_characters(self, codec, text):
+        with pytest.raises(ValueError):
+            MultibaseEncoder.decode("z" + text)
+
+    def test_empty_multibase_string(self, codec):
+        with pytest.raises(ValueError, match="Empty multibase string"):
+            MultibaseEncoder.decode("")
+
+    def test_unsupported_prefix(self, codec):
+        with pytest.raises(ValueError, match="Unsupported multibase prefix"):
+            MultibaseEncoder.decode("fdeadbeef")
+
+    def test_unsupported_encoding(self, codec):
+        with pytest.raises(ValueError, match="Unsupported encoding"):
+            MultibaseEncoder.encode(b"data", encoding="base64")
+
+
+class TestDidKeyIdentifiers:
+    """did:key construction and extraction on top of the codec"""
+
+    def test_round_trip(self, codec):
+        public_key = os.urandom(32)
+        did = create_did_key_identifier(public_key)
+
+        assert did.startswith("did:key:z")
+        extract_public_key_from_did.cache_clear()
+        assert extract_public_key_from_did(did) == ("Ed25519", public_key)
+
+    def test_batch_matches_single(self, codec):
+        public_keys = [os.urandom(32) for _ in range(10)] + [b"\x00" * 32]
+        assert create_did_key_identifiers(public_keys) == [
+            create_did_key_identifier(public_key) for public_key in public_keys
+        ]
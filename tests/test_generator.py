@@ -0,0 +1,131 @@
+"""
+Tests for DIDGenerator
+Spec reference: Section 6.2 - JSON Representation
+"""
+import json
+
+import pytest
+
+from payelink_agent_identity import Identity, SecretBytes
+from payelink_agent_identity.sdk.generator import DIDGenerator
+from payelink_agent_identity.sdk.types import DIDDocument, ServiceEndpoint, VerificationMethod
+from payelink_agent_identity.utils.constants import DID_CONTEXT_V1, VR_AUTHENTICATION
+
+DID = "did:key:z6MkhaXgBZDvotDkL5257faiztiGiC2QtKLGpbnnEGta2doK"
+
+
+class TestExportMemo:
+    """Memoized export output must always match the current document"""
+
+    def test_repeated_export_is_memoized(self):
+        document = Identity.create().document
+
+        assert document.json() is document.json()
+        assert document.json_ld() == document.json()
+
+    def test_top_level_list_mutation(self):
+        document = Identity.create().document
+        before = json.loads(document.json())
+
+        document.authentication.append(DID + "#extra")
+        after = json.loads(document.json())
+
+        assert after["authentication"] == before["authentication"] + [DID + "#extra"]
+
+    def test_nested_context_dict_mutation(self):
+        document = DIDDocument(**{"@context": [DID_CONTEXT_V1, {"a": "b"}], "id": DID})
+        assert json.loads(document.json())["@context"][1] == {"a": "b"}
+
+        document.context[1]["a"] = "CHANGED"
+
+        assert json.loads(document.json())["@context"][1] == {"a": "CHANGED"}
+        assert document.model_dump(by_alias=True)["@context"][1] == {"a": "CHANGED"}
+
+    def test_nested_public_key_jwk_mutation(self):
+        method = VerificationMethod(
+            id=DID + "#key-1",
+            type="JsonWebKey2020",
+            controller=DID,
+            publicKeyJwk={"kty": "OKP", "crv": "Ed25519", "x": "abc"},
+        )
+        document = DIDDocument(id=DID, verificationMethod=[method])
+        document.json()
+
+        method.publicKeyJwk["x"] = "CHANGED"
+
+        exported = json.loads(document.json())
+        assert exported["verificationMethod"][0]["publicKeyJwk"]["x"] == "CHANGED"
+
+    def test_nested_service_endpoint_mutation(self):
+        service = ServiceEndpoint(
+            id=DID + "#inbox",
+            type="MessagingService",
+            serviceEndpoint={"uri": "https://agent.example.com/inbox"},
+        )
+        document = DIDDocument(id=DID, service=[service])
+        document.json()
+
+        service.serviceEndpoint["uri"] = "https://agent.example.com/changed"
+
+        exported = json.loads(DIDGenerator().export_json(document))
+        assert exported["service"][0]["serviceEndpoint"]["uri"] == (
+            "https://agent.example.com/changed"
+        )
+
+
+class TestBatchGeneration:
+    """generate_batch and generate_many"""
+
+    def test_generate_batch(self):
+        results = DIDGenerator().generate_batch(5, also_known_as=["https://agent.example.com"])
+
+        assert len(results) == 5
+        assert len({result.did for result in results}) == 5
+        assert len({bytes(result.private_key) for result in results}) == 5
+        for result in results:
+            assert result.document.id == result.did
+            assert result.document.alsoKnownAs == ["https://agent.example.com"]
+
+    def test_generate_batch_documents_do_not_share_lists(self):
+        first, second = DIDGenerator().generate_batch(2, also_known_as=["https://a.example"])
+
+        first.document.alsoKnownAs.append("https://b.example")
+
+        assert second.document.alsoKnownAs == ["https://a.example"]
+
+    def test_generate_batch_empty(self):
+        assert DIDGenerator().generate_batch(0) == []
+
+    @pytest.mark.parametrize("max_workers", [None, 1, 3, 64])
+    def test_generate_many(self, max_workers):
+        results = DIDGenerator().generate_many(10, max_workers=max_workers)
+
+        assert len(results) == 10
+        assert len({result.did for result in results}) == 10
+
+    def test_generate_many_empty(self):
+        assert DIDGenerator().generate_many(0) == []
+
+    @pytest.mark.parametrize("max_workers", [0, -1])
+    def test_generate_many_rejects_max_workers_below_one(self, max_workers):
+        with pytest.raises(ValueError, match="max_workers"):
+            DIDGenerator().generate_many(3, max_workers=max_workers)
+
+    def test_generate_many_rejects_negative_n(self):
+        with pytest.raises(ValueError, match="non-negative"):
+            DIDGenerator().generate_many(-1)
+
+    def test_generate_many_with_processes(self):
+        results = DIDGenerator().generate_many(
+            6,
+            verification_relationships=[VR_AUTHENTICATION],
+            max_workers=2,
+            use_processes=True,
+        )
+
+        assert len(results) == 6
+        assert len({result.did for result in results}) == 6
+        for result in results:
+            assert isinstance(result.private_key, SecretBytes)
+            assert result.document.authentication == [result.document.verificationMethod[0].id]
+            assert result.document.assertionMethod is None
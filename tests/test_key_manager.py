@@ -0,0 +1,168 @@
+"""
+Tests for Ed25519 key generation and public key validation
+Spec reference: Section 5.2 - Verification Methods
+"""
+import os
+
+import pytest
+
+from payelink_agent_identity.crypto import ed25519
+from payelink_agent_identity.crypto.ed25519 import is_valid_point
+from payelink_agent_identity.sdk import key_manager
+from payelink_agent_identity.sdk.key_manager import KeyManager
+
+P = 2**255 - 19
+
+# Encodings of the eight small-order points, plus their non-canonical
+# (sign bit set on x = 0) variants
+SMALL_ORDER = [
+    bytes.fromhex(value)
+    for value in (
+        # Identity (order 1)
+        "0100000000000000000000000000000000000000000000000000000000000000",
+        # Order 2 (y = -1)
+        "ecffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff7f",
+        # Order 4 (y = 0)
+        "0000000000000000000000000000000000000000000000000000000000000000",
+        "0000000000000000000000000000000000000000000000000000000000000080",
+        # Order 8
+        "c7176a703d4dd84fba3c0b760d10670f2a2053fa2c39ccc64ec7fd7792ac037a",
+        "c7176a703d4dd84fba3c0b760d10670f2a2053fa2c39ccc64ec7fd7792ac03fa",
+        "26e8958fc2b227b045c3f489f2ef98f0d5dfac05d3c63339b13802886d53fc05",
+        "26e8958fc2b227b045c3f489f2ef98f0d5dfac05d3c63339b13802886d53fc85",
+        # Non-canonical identity and order-2 point (x = 0 with the sign bit)
+        "0100000000000000000000000000000000000000000000000000000000000080",
+        "ecffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff",
+    )
+]
+
+# y >= p: the field element is not reduced, so the encoding is not canonical
+NON_CANONICAL = [
+    (P + offset).to_bytes(32, "little") for offset in range(19)
+] + [
+    ((P + offset) | (1 << 255)).to_bytes(32, "little") for offset in range(19)
+]
+
+
+def _encode(point):
+    """Encode an extended-coordinates point as 32 bytes (RFC 8032 5.1.2)"""
+    x, y, z, _ = point
+    z_inv = pow(z, P - 2, P)
+    x, y = (x * z_inv) % P, (y * z_inv) % P
+    return (y | ((x & 1) << 255)).to_bytes(32, "little")
+
+
+def _generated_public_keys(n):
+    return [pair.public_key for pair in KeyManager.generate_ed25519_keypair_batch(n)]
+
+
+def _mixed_order_key():
+    """A generated key plus a point of order 8: on the curve, not in the subgroup"""
+    public_key = _generated_public_keys(1)[0]
+    point = ed25519._decode_point(public_key)
+    torsion = ed25519._decode_point(SMALL_ORDER[4])
+    return _encode(ed25519._add(point, torsion))
+
+
+@pytest.fixture(params=["nacl", "pure-python"])
+def backend(request, monkeypatch):
+    """Run strict validation against both point checks"""
+    if request.param == "nacl":
+        if key_manager._nacl_signing() is None:
+            pytest.skip("PyNaCl is not installed")
+    else:
+        monkeypatch.setattr(key_manager, "_nacl_signing", lambda: None)
+    return request.param
+
+
+class TestIsValidPoint:
+    """Pure-Python point check used when PyNaCl is not installed"""
+
+    def test_generated_keys(self):
+        for public_key in _generated_public_keys(20):
+            assert is_valid_point(public_key)
+
+    @pytest.mark.parametrize("encoded", SMALL_ORDER)
+    def test_small_order_points(self, encoded):
+        assert not is_valid_point(encoded)
+
+    @pytest.mark.parametrize("encoded", NON_CANONICAL)
+    def test_non_canonical_y(self, encoded):
+        assert not is_valid_point(encoded)
+
+    def test_identity(self):
+        assert not is_valid_point((1).to_bytes(32, "little"))
+
+    def test_mixed_order_point(self):
+        encoded = _mixed_order_key()
+
+        assert ed25519._decode_point(encoded) is not None
+        assert not is_valid_point(encoded)
+
+    def test_off_curve(self):
+        # y = 2 has no matching x on the curve
+        assert ed25519._decode_point((2).to_bytes(32, "little")) is None
+        assert not is_valid_point((2).to_bytes(32, "little"))
+
+    @pytest.mark.parametrize("length", [0, 31, 33])
+    def test_wrong_length(self, length):
+        assert not is_valid_point(bytes(length))
+
+    def test_matches_libsodium(self):
+        bindings = pytest.importorskip("nacl.bindings")
+        check = bindings.crypto_core_ed25519_is_valid_point
+
+        candidates = (
+            SMALL_ORDER
+            + NON_CANONICAL
+            + _generated_public_keys(50)
+            + [_mixed_order_key() for _ in range(10)]
+            + [os.urandom(32) for _ in range(500)]
+        )
+        for encoded in candidates:
+            assert is_valid_point(encoded) == check(encoded), encoded.hex()
+
+
+class TestValidatePublicKey:
+    """KeyManager.validate_public_key in default and strict mode"""
+
+    def test_default_mode_checks_length_only(self):
+        assert KeyManager.validate_public_key(SMALL_ORDER[0])
+        assert not KeyManager.validate_public_key(bytes(31))
+
+    def test_strict_accepts_generated_keys(self, backend):
+        for public_key in _generated_public_keys(5):
+            assert KeyManager.validate_public_key(public_key, strict=True)
+
+    def test_strict_rejects_invalid_points(self, backend):
+        for encoded in SMALL_ORDER + NON_CANONICAL[:3] + [_mixed_order_key()]:
+            assert not KeyManager.validate_public_key(encoded, strict=True)
+
+    def test_strict_rejects_wrong_length(self, backend):
+        assert not KeyManager.validate_public_key(bytes(33), strict=True)
+
+    def test_unsupported_key_type(self):
+        assert not KeyManager.validate_public_key(_generated_public_keys(1)[0], "X25519")
+
+
+class TestKeyGeneration:
+    """Ed25519 key pairs from either backend"""
+
+    def test_backends_derive_the_same_public_key(self, monkeypatch):
+        if key_manager._nacl_signing() is None:
+            pytest.skip("PyNaCl is not installed")
+        seed = os.urandom(32)
+
+        with_nacl = KeyManager._ed25519_keypair(seed)
+        monkeypatch.setattr(key_manager, "_nacl_signing", lambda: None)
+        with_cryptography = KeyManager._ed25519_keypair(seed)
+
+        assert with_nacl.public_key == with_cryptography.public_key
+
+    def test_batch_size(self):
+        assert len(KeyManager.generate_ed25519_keypair_batch(3)) == 3
+        assert KeyManager.generate_ed25519_keypair_batch(0) == []
+
+    def test_negative_batch_size(self):
+        with pytest.raises(ValueError):
+            KeyManager.generate_ed25519_keypair_batch(-1)
@@ -0,0 +1,100 @@
+"""
+Tests for private key handling (SecretBytes)
+"""
+import pytest
+
+from payelink_agent_identity import DIDGenerator, Identity, SecretBytes
+from payelink_agent_identity.sdk.key_manager import KeyManager, _nacl_signing
+from payelink_agent_identity.sdk.types import DIDGenerationResult
+
+KEY = bytes(range(32))
+
+
+class TestSecretBytes:
+    """Private key material must never be printed and must be zeroizable"""
+
+    def test_repr_str_and_format_are_redacted(self):
+        secret = SecretBytes(KEY)
+
+        for text in (repr(secret), str(secret), f"{secret}", format(secret, ">40"), "%s" % secret):
+            assert "<32 bytes>" in text
+            assert KEY.hex() not in text
+            assert "\\x1f" not in text
+
+    def test_behaves_like_the_key_bytes(self):
+        secret = SecretBytes(KEY)
+
+        assert secret == KEY
+        assert bytes(secret) == KEY
+        assert secret.hex() == KEY.hex()
+
+    def test_is_unhashable(self):
+        with pytest.raises(TypeError):
+            hash(SecretBytes(KEY))
+
+    def test_zeroize(self):
+        secret = SecretBytes(KEY)
+        copy = bytes(secret)
+
+        secret.zeroize()
+
+        assert secret == bytes(32)
+        assert len(secret) == 32
+        assert copy == KEY
+
+
+class TestPrivateKeyBoundary:
+    """Generated private keys are SecretBytes at every public entry point"""
+
+    def test_generated_keys_are_secret_bytes(self):
+        result = DIDGenerator().generate()
+        identity = Identity.create()
+
+        assert isinstance(result.private_key, SecretBytes)
+        assert isinstance(identity.private_key, SecretBytes)
+        assert len(identity.private_key) == 32
+
+    def test_batch_keys_are_distinct_secret_bytes(self):
+        key_pairs = KeyManager.generate_ed25519_keypair_batch(5)
+
+        assert all(isinstance(pair.private_key, SecretBytes) for pair in key_pairs)
+        assert len({bytes(pair.private_key) for pair in key_pairs}) == 5
+
+    def test_result_accepts_plain_bytes(self):
+        result = DIDGenerator().generate()
+
+        for private_key in (KEY, bytearray(KEY)):
+            validated = DIDGenerationResult(
+                did=result.did,
+                document=result.document,
+                public_key=result.public_key,
+                private_key=private_key,
+                key_type=result.key_type,
+            )
+            assert isinstance(validated.private_key, SecretBytes)
+            assert validated.private_key == KEY
+
+    def test_result_keeps_existing_secret_bytes(self):
+        result = DIDGenerator().generate()
+        secret = SecretBytes(KEY)
+
+        validated = DIDGenerationResult(**{**dict(result), "private_key": secret})
+
+        assert validated.private_key is secret
+
+    def test_identity_wraps_plain_bytes(self):
+        result = DIDGenerator().generate()
+        identity = Identity(result.did, result.document, result.public_key, KEY)
+
+        assert isinstance(identity.private_key, SecretBytes)
+        assert identity.private_key == KEY
+
+    def test_bytes_copy_works_with_pynacl(self):
+        signing = _nacl_signing()
+        if signing is None:
+            pytest.skip("PyNaCl is not installed")
+
+        identity = Identity.create()
+        signing_key = signing.SigningKey(bytes(identity.private_key))
+
+        assert signing_key.verify_key.encode() == identity.public_key
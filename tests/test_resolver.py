@@ -0,0 +1,165 @@
+"""
+Tests for did:key resolution
+Spec reference: Section 7.1 - DID Resolution
+"""
+import threading
+
+import pytest
+
+from payelink_agent_identity import (
+    DIDGenerator,
+    InvalidDIDSyntaxError,
+    PublicKeyExtractionError,
+    UnsupportedMethodError,
+)
+from payelink_agent_identity.sdk.resolver import DIDKeyResolver
+
+
+def _dids(n):
+    return [result.did for result in DIDGenerator().generate_batch(n)]
+
+
+class TestResolutionCache:
+    """Per-resolver LRU cache of resolved documents"""
+
+    def test_cache_is_bounded(self):
+        resolver = DIDKeyResolver(cache_size=3)
+
+        for did in _dids(10):
+            resolver.resolve(did)
+
+        assert len(resolver._doc_cache) == 3
+
+    def test_least_recently_used_is_evicted(self):
+        resolver = DIDKeyResolver(cache_size=2)
+        first, second, third = _dids(3)
+
+        resolver.resolve(first)
+        resolver.resolve(second)
+        resolver.resolve(first)  # first is now the most recently used
+        resolver.resolve(third)
+
+        assert list(resolver._doc_cache) == [first, third]
+
+    def test_cache_size_zero_disables_caching(self):
+        resolver = DIDKeyResolver(cache_size=0)
+        did = _dids(1)[0]
+
+        first = resolver.resolve(did)
+        second = resolver.resolve(did)
+
+        assert len(resolver._doc_cache) == 0
+        assert first == second
+        assert first is not second
+
+    def test_hit_returns_equal_but_distinct_document(self):
+        resolver = DIDKeyResolver()
+        did = _dids(1)[0]
+
+        first = resolver.resolve(did)
+        second = resolver.resolve(did)
+
+        assert first == second
+        assert first is not second
+        assert first is not resolver._doc_cache[did]
+        assert first.authentication is not second.authentication
+
+    def test_mutating_a_result_does_not_affect_later_resolves(self):
+        resolver = DIDKeyResolver()
+        did = _dids(1)[0]
+
+        first = resolver.resolve(did)
+        expected = first.model_dump()
+        first.authentication.append(did + "#extra")
+        first.verificationMethod.clear()
+
+        assert resolver.resolve(did).model_dump() == expected
+
+    def test_concurrent_resolves_with_eviction(self):
+        resolver = DIDKeyResolver(cache_size=4)
+        dids = _dids(16)
+        errors = []
+
+        def work():
+            try:
+                for _ in range(20):
+                    for did in dids:
+                        assert resolver.resolve(did).id == did
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(resolver._doc_cache) <= 4
+
+
+class TestResolveMany:
+    """Batch resolution matches resolve() per DID"""
+
+    def test_matches_resolve(self):
+        resolver = DIDKeyResolver()
+        dids = _dids(5)
+
+        assert resolver.resolve_many(dids) == [resolver.resolve(did) for did in dids]
+
+    def test_repeated_did_gets_distinct_documents(self):
+        for cache_size in (0, 1024):
+            resolver = DIDKeyResolver(cache_size=cache_size)
+            did = _dids(1)[0]
+
+            a, b = resolver.resolve_many([did, did])
+            a.authentication.append(did + "#extra")
+
+            assert a is not b
+            assert b == resolver.resolve(did)
+            assert did + "#extra" not in b.authentication
+
+
+class TestResolveWithMetadata:
+    """Resolution metadata error codes (Spec 7.1.2)"""
+
+    def test_success(self):
+        did = _dids(1)[0]
+
+        result = DIDKeyResolver().resolve_with_metadata(did)
+
+        assert result.didResolutionMetadata == {"contentType": "application/did+ld+json"}
+        assert result.didDocument.id == did
+        assert result.didDocumentMetadata == {}
+
+    def test_invalid_did(self):
+        for did in ("not-a-did", "did:key", "did:key:" + "z" * 5000):
+            result = DIDKeyResolver().resolve_with_metadata(did)
+
+            assert result.didResolutionMetadata["error"] == "invalidDid"
+            assert result.didDocument is None
+
+    def test_method_not_supported(self):
+        result = DIDKeyResolver().resolve_with_metadata("did:web:example.com")
+
+        assert result.didResolutionMetadata["error"] == "methodNotSupported"
+        assert "Only did:key is supported" in result.didResolutionMetadata["errorMessage"]
+        assert result.didDocument is None
+
+    def test_not_found(self):
+        # Well-formed, but the multibase value contains a non-base58 character
+        result = DIDKeyResolver().resolve_with_metadata("did:key:z0abc")
+
+        assert result.didResolutionMetadata["error"] == "notFound"
+        assert result.didDocument is None
+
+    def test_errors_are_raised_by_resolve(self):
+        resolver = DIDKeyResolver()
+
+        for did, error in (
+            ("not-a-did", InvalidDIDSyntaxError),
+            ("did:web:example.com", UnsupportedMethodError),
+            ("did:key:z0abc", PublicKeyExtractionError),
+        ):
+            with pytest.raises(error):
+                resolver.resolve(did)